@@ -0,0 +1,23 @@
+"""Add index on item.owner_id
+
+Revision ID: 7f3b2a91c4d5
+Revises: 1a31ce608336
+Create Date: 2026-08-31 10:12:45.102938
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '7f3b2a91c4d5'
+down_revision = '1a31ce608336'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(op.f('ix_item_owner_id'), 'item', ['owner_id'], unique=False)
+
+
+def downgrade():
+    op.drop_index(op.f('ix_item_owner_id'), table_name='item')
@@ -19,7 +19,9 @@ reusable_oauth2 = OAuth2PasswordBearer(
 
 
 def get_db() -> Generator[Session, None, None]:
-    with Session(engine) as session:
+    # expire_on_commit=False keeps just-written objects usable for response
+    # serialization without a refresh round-trip after commit.
+    with Session(engine, expire_on_commit=False) as session:
         yield session
 
 
@@ -1,7 +1,7 @@
 from datetime import timedelta
 from typing import Any
 
-from fastapi import HTTPException
+from fastapi import BackgroundTasks, HTTPException
 from fastapi.responses import HTMLResponse
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlmodel import Session
@@ -49,7 +49,9 @@ class AuthService:
         return current_user
 
     @staticmethod
-    def recover_password(email: str, session: Session) -> Message:
+    def recover_password(
+        email: str, session: Session, background_tasks: BackgroundTasks
+    ) -> Message:
         """
         Password Recovery
         """
@@ -64,7 +66,9 @@ class AuthService:
         email_data = generate_reset_password_email(
             email_to=user.email, email=email, token=password_reset_token
         )
-        send_email(
+        # SMTP delivery is slow; send after the response has gone out.
+        background_tasks.add_task(
+            send_email,
             email_to=user.email,
             subject=email_data.subject,
             html_content=email_data.html_content,
@@ -2,7 +2,7 @@ import uuid
 from typing import Any
 
 from fastapi import HTTPException
-from sqlmodel import Session, func, select
+from sqlmodel import Session, func, literal, or_, select
 
 from app.models import Item, ItemCreate, ItemPublic, ItemsPublic, ItemUpdate, Message
 
@@ -15,25 +15,22 @@ class ItemService:
         """
         Retrieve items.
         """
-        if current_user.is_superuser:
-            count_statement = select(func.count()).select_from(Item)
-            count = session.exec(count_statement).one()
-            statement = select(Item).offset(skip).limit(limit)
-            items = session.exec(statement).all()
+        # Superusers see everything; the bound boolean keeps a single compiled
+        # statement shape for both cases.
+        owner_scope = or_(
+            literal(current_user.is_superuser), Item.owner_id == current_user.id
+        )
+        statement = select(Item, func.count().over().label("total")).where(owner_scope)
+        count_statement = select(func.count()).select_from(Item).where(owner_scope)
+        rows = session.exec(statement.offset(skip).limit(limit)).all()
+        if rows:
+            items = [row[0] for row in rows]
+            count = rows[0][1]
         else:
-            count_statement = (
-                select(func.count())
-                .select_from(Item)
-                .where(Item.owner_id == current_user.id)
-            )
+            # Page past the end of the result set: the window count is not
+            # available, so fall back to a plain count.
+            items = []
             count = session.exec(count_statement).one()
-            statement = (
-                select(Item)
-                .where(Item.owner_id == current_user.id)
-                .offset(skip)
-                .limit(limit)
-            )
-            items = session.exec(statement).all()
 
         return ItemsPublic(data=items, count=count)
 
@@ -59,9 +56,25 @@ class ItemService:
         item = Item.model_validate(item_in, update={"owner_id": current_user.id})
         session.add(item)
         session.commit()
-        session.refresh(item)
         return item
 
+    @staticmethod
+    def create_items(
+        session: Session, current_user: Any, items_in: list[ItemCreate]
+    ) -> ItemsPublic:
+        """
+        Create several new items in one batch.
+        """
+        items = [
+            Item.model_validate(item_in, update={"owner_id": current_user.id})
+            for item_in in items_in
+        ]
+        # ids are generated client-side, so add_all batches these into a
+        # single multi-row INSERT (insertmanyvalues) instead of one per row.
+        session.add_all(items)
+        session.commit()
+        return ItemsPublic(data=items, count=len(items))
+
     @staticmethod
     def update_item(
         session: Session, current_user: Any, item_id: uuid.UUID, item_in: ItemUpdate
@@ -78,7 +91,6 @@ class ItemService:
         item.sqlmodel_update(update_dict)
         session.add(item)
         session.commit()
-        session.refresh(item)
         return item
 
     @staticmethod
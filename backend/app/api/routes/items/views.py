@@ -1,23 +1,44 @@
 import uuid
 from typing import Any
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Request, Response
 
 from app.api.deps import CurrentUser, SessionDep
 from app.api.routes.items.service import ItemService
 from app.models import ItemCreate, ItemPublic, ItemsPublic, ItemUpdate, Message
+from app.utils import compute_etag
 
 router = APIRouter(prefix="/items", tags=["items"])
 
 
 @router.get("/", response_model=ItemsPublic)
 def read_items(
-    session: SessionDep, current_user: CurrentUser, skip: int = 0, limit: int = 100
+    request: Request,
+    response: Response,
+    session: SessionDep,
+    current_user: CurrentUser,
+    skip: int = 0,
+    limit: int = 100,
 ) -> Any:
     """
     Retrieve items.
     """
-    return ItemService.get_items(session, current_user, skip, limit)
+    items = ItemService.get_items(session, current_user, skip, limit)
+    etag = compute_etag(items)
+    if request.headers.get("If-None-Match") == etag:
+        # RFC 9110: the 304 must carry the headers the 200 would have sent.
+        return Response(
+            status_code=304,
+            headers={
+                "ETag": etag,
+                "Cache-Control": "private, max-age=0, must-revalidate",
+                "Vary": "Authorization",
+            },
+        )
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "private, max-age=0, must-revalidate"
+    response.headers["Vary"] = "Authorization"
+    return items
 
 
 @router.get("/{id}", response_model=ItemPublic)
@@ -38,6 +59,16 @@ def create_item(
     return ItemService.create_item(session, current_user, item_in)
 
 
+@router.post("/bulk", response_model=ItemsPublic)
+def create_items(
+    *, session: SessionDep, current_user: CurrentUser, items_in: list[ItemCreate]
+) -> Any:
+    """
+    Create multiple items in one request.
+    """
+    return ItemService.create_items(session, current_user, items_in)
+
+
 @router.put("/{id}", response_model=ItemPublic)
 def update_item(
     *,
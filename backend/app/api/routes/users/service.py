@@ -1,7 +1,7 @@
 import uuid
 from typing import Any
 
-from fastapi import HTTPException
+from fastapi import BackgroundTasks, HTTPException
 from sqlmodel import Session, col, delete, func, select
 
 from app import crud
@@ -28,16 +28,23 @@ class UserService:
         """
         Retrieve users.
         """
-        count_statement = select(func.count()).select_from(User)
-        count = session.exec(count_statement).one()
-
-        statement = select(User).offset(skip).limit(limit)
-        users = session.exec(statement).all()
+        statement = select(User, func.count().over().label("total"))
+        rows = session.exec(statement.offset(skip).limit(limit)).all()
+        if rows:
+            users = [row[0] for row in rows]
+            count = rows[0][1]
+        else:
+            # Page past the end of the result set: the window count is not
+            # available, so fall back to a plain count.
+            users = []
+            count = session.exec(select(func.count()).select_from(User)).one()
 
         return UsersPublic(data=users, count=count)
 
     @staticmethod
-    def create_user(session: Session, user_in: UserCreate) -> UserPublic:
+    def create_user(
+        session: Session, user_in: UserCreate, background_tasks: BackgroundTasks
+    ) -> UserPublic:
         """
         Create new user.
         """
@@ -53,7 +60,9 @@ class UserService:
             email_data = generate_new_account_email(
                 email_to=user_in.email, username=user_in.email, password=user_in.password
             )
-            send_email(
+            # SMTP delivery is slow; send after the response has gone out.
+            background_tasks.add_task(
+                send_email,
                 email_to=user_in.email,
                 subject=email_data.subject,
                 html_content=email_data.html_content,
@@ -77,7 +86,6 @@ class UserService:
         current_user.sqlmodel_update(user_data)
         session.add(current_user)
         session.commit()
-        session.refresh(current_user)
         return current_user
 
     @staticmethod
@@ -188,7 +196,11 @@ class UserService:
             raise HTTPException(
                 status_code=403, detail="Super users are not allowed to delete themselves"
             )
-        statement = delete(Item).where(col(Item.owner_id) == user_id)
+        statement = (
+            delete(Item)
+            .where(col(Item.owner_id) == user_id)
+            .execution_options(synchronize_session=False)
+        )
         session.exec(statement)  # type: ignore
         session.delete(user)
         session.commit()
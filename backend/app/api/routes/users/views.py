@@ -1,7 +1,7 @@
 import uuid
 from typing import Any
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, BackgroundTasks, Depends, Request, Response
 
 from app.api.deps import (
     CurrentUser,
@@ -19,6 +19,7 @@ from app.models import (
     UserUpdate,
     UserUpdateMe,
 )
+from app.utils import compute_etag
 
 router = APIRouter(prefix="/users", tags=["users"])
 
@@ -28,21 +29,44 @@ router = APIRouter(prefix="/users", tags=["users"])
     dependencies=[Depends(get_current_active_superuser)],
     response_model=UsersPublic,
 )
-def read_users(session: SessionDep, skip: int = 0, limit: int = 100) -> Any:
+def read_users(
+    request: Request,
+    response: Response,
+    session: SessionDep,
+    skip: int = 0,
+    limit: int = 100,
+) -> Any:
     """
     Retrieve users.
     """
-    return UserService.get_users(session, skip, limit)
+    users = UserService.get_users(session, skip, limit)
+    etag = compute_etag(users)
+    if request.headers.get("If-None-Match") == etag:
+        # RFC 9110: the 304 must carry the headers the 200 would have sent.
+        return Response(
+            status_code=304,
+            headers={
+                "ETag": etag,
+                "Cache-Control": "private, max-age=0, must-revalidate",
+                "Vary": "Authorization",
+            },
+        )
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "private, max-age=0, must-revalidate"
+    response.headers["Vary"] = "Authorization"
+    return users
 
 
 @router.post(
     "/", dependencies=[Depends(get_current_active_superuser)], response_model=UserPublic
 )
-def create_user(*, session: SessionDep, user_in: UserCreate) -> Any:
+def create_user(
+    *, session: SessionDep, user_in: UserCreate, background_tasks: BackgroundTasks
+) -> Any:
     """
     Create new user.
     """
-    return UserService.create_user(session, user_in)
+    return UserService.create_user(session, user_in, background_tasks)
 
 
 @router.patch("/me", response_model=UserPublic)
@@ -1,3 +1,4 @@
+import hashlib
 import logging
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
@@ -8,6 +9,7 @@ import emails  # type: ignore
 import jwt
 from jinja2 import Template
 from jwt.exceptions import InvalidTokenError
+from sqlmodel import SQLModel
 
 from app.core import security
 from app.core.config import settings
@@ -16,6 +18,14 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+def compute_etag(payload: SQLModel) -> str:
+    """
+    Build a strong ETag from the serialized response payload.
+    """
+    digest = hashlib.sha1(payload.model_dump_json().encode()).hexdigest()
+    return f'"{digest}"'
+
+
 @dataclass
 class EmailData:
     html_content: str
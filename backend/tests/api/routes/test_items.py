@@ -24,6 +24,59 @@ def test_create_item(
     assert "owner_id" in content
 
 
+def test_read_items_etag_revalidation(
+    client: TestClient, superuser_token_headers: dict[str, str], db: Session
+) -> None:
+    create_random_item(db)
+    response = client.get(
+        f"{settings.API_V1_STR}/items/", headers=superuser_token_headers
+    )
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+    assert response.headers["Cache-Control"] == "private, max-age=0, must-revalidate"
+    assert response.headers["Vary"] == "Authorization"
+
+    response = client.get(
+        f"{settings.API_V1_STR}/items/",
+        headers={**superuser_token_headers, "If-None-Match": etag},
+    )
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+    assert response.headers["Cache-Control"] == "private, max-age=0, must-revalidate"
+    assert response.headers["Vary"] == "Authorization"
+
+    create_random_item(db)
+    response = client.get(
+        f"{settings.API_V1_STR}/items/",
+        headers={**superuser_token_headers, "If-None-Match": etag},
+    )
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+
+def test_create_items_bulk(
+    client: TestClient, superuser_token_headers: dict[str, str]
+) -> None:
+    data = [
+        {"title": "Foo", "description": "Fighters"},
+        {"title": "Bar", "description": "Tenders"},
+    ]
+    response = client.post(
+        f"{settings.API_V1_STR}/items/bulk",
+        headers=superuser_token_headers,
+        json=data,
+    )
+    assert response.status_code == 200
+    content = response.json()
+    assert content["count"] == len(data)
+    assert len(content["data"]) == len(data)
+    for item, item_in in zip(content["data"], data, strict=True):
+        assert item["title"] == item_in["title"]
+        assert item["description"] == item_in["description"]
+        assert "id" in item
+        assert "owner_id" in item
+
+
 def test_read_item(
     client: TestClient, superuser_token_headers: dict[str, str], db: Session
 ) -> None:
@@ -168,6 +168,36 @@ def test_retrieve_users(
         assert "email" in item
 
 
+def test_retrieve_users_etag_revalidation(
+    client: TestClient, superuser_token_headers: dict[str, str], db: Session
+) -> None:
+    response = client.get(
+        f"{settings.API_V1_STR}/users/", headers=superuser_token_headers
+    )
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+    assert response.headers["Cache-Control"] == "private, max-age=0, must-revalidate"
+    assert response.headers["Vary"] == "Authorization"
+
+    response = client.get(
+        f"{settings.API_V1_STR}/users/",
+        headers={**superuser_token_headers, "If-None-Match": etag},
+    )
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+    assert response.headers["Cache-Control"] == "private, max-age=0, must-revalidate"
+    assert response.headers["Vary"] == "Authorization"
+
+    user_in = UserCreate(email=random_email(), password=random_lower_string())
+    crud.create_user(session=db, user_create=user_in)
+    response = client.get(
+        f"{settings.API_V1_STR}/users/",
+        headers={**superuser_token_headers, "If-None-Match": etag},
+    )
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+
 def test_update_user_me(
     client: TestClient, normal_user_token_headers: dict[str, str], db: Session
 ) -> None: